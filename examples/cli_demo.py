@@ -10,17 +10,15 @@ import os
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-# Simulate command-line arguments
-original_argv = sys.argv.copy()
+from sirens import cli
+
 
 def demo_list_command():
     """Demo the list command."""
     print("=" * 60)
     print("DEMO: sirens list")
     print("=" * 60)
-    sys.argv = ["sirens", "list"]
-    from sirens.cli import main
-    main()
+    cli.main(["list"])
     print()
 
 
@@ -29,9 +27,7 @@ def demo_info_command(siren_type):
     print("=" * 60)
     print(f"DEMO: sirens info {siren_type}")
     print("=" * 60)
-    sys.argv = ["sirens", "info", siren_type]
-    from sirens.cli import main
-    main()
+    cli.main(["info", siren_type])
     print()
 
 
@@ -40,9 +36,7 @@ def demo_help():
     print("=" * 60)
     print("DEMO: sirens (no arguments - shows help)")
     print("=" * 60)
-    sys.argv = ["sirens"]
-    from sirens.cli import main
-    main()
+    cli.main([])
     print()
 
 
@@ -95,7 +89,4 @@ def main():
 
 
 if __name__ == "__main__":
-    try:
-        main()
-    finally:
-        sys.argv = original_argv
+    main()
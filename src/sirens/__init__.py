@@ -5,14 +5,24 @@ Generate, play, and manipulate realistic siren sounds.
 
 __version__ = "0.1.0"
 
-from .core import Siren
 from .presets import PRESETS, register_custom_siren, get_available_sirens
 from .cli import main
 
 __all__ = [
     "Siren",
+    "SirenConfig",
     "PRESETS",
     "register_custom_siren",
     "get_available_sirens",
     "main",
 ]
+
+
+def __getattr__(name):
+    # Load the siren classes on first use, so the CLI can list sirens
+    # without importing the generation machinery
+    if name in ("Siren", "SirenConfig"):
+        from . import core
+
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,112 +1,162 @@
 """Command-line interface for the sirens package."""
 
+import math
 import sys
-from .core import Siren
 from .presets import PRESETS, get_available_sirens
 
 
-def main():
-    """Process command line arguments and execute sirens functionality."""
-    if len(sys.argv) < 2:
-        print_usage()
-        return
+def _non_negative(parse):
+    """Return an argparse type parsing with ``parse`` that rejects negatives."""
+    import argparse
 
-    command = sys.argv[1]
+    def convert(value):
+        try:
+            number = parse(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                f"invalid {parse.__name__} value: {value!r}"
+            ) from None
+        if not 0 <= number < math.inf:
+            raise argparse.ArgumentTypeError(f"must be a finite number >= 0: {value}")
+        return number
 
-    # Handle list command without requiring a siren type
-    if command == "list":
-        list_sirens()
-        return
+    return convert
+
+
+def _build_parser():
+    """Build the argument parser for the sirens command line."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="sirens",
+        description="French emergency vehicle siren simulator.",
+    )
+    parser.set_defaults(func=lambda args: print_usage())
+    subparsers = parser.add_subparsers(dest="command")
+    list_parser = subparsers.add_parser("list", help="List all available siren types")
+    list_parser.set_defaults(func=lambda args: list_sirens())
+
+    for command, func, help_text in (
+        ("info", _info_command, "Show detailed siren information"),
+        ("write", _write_command, "Generate and save siren audio"),
+        ("play", _play_command, "Generate and play siren audio"),
+    ):
+        sub = subparsers.add_parser(command, help=help_text)
+        sub.set_defaults(func=func)
+        sub.add_argument("siren_type", help="Type of siren, e.g. police")
+        sub.add_argument(
+            "--duration",
+            type=_non_negative(float),
+            default=10,
+            help="Duration in seconds",
+        )
+        sub.add_argument(
+            "--night", action="store_true", help="Enable night mode (reduced volume)"
+        )
+        sub.add_argument(
+            "--traffic",
+            choices=["light", "medium", "heavy"],
+            default="medium",
+            help="Traffic density",
+        )
+        sub.add_argument(
+            "--distance",
+            type=float,
+            default=10,
+            help="Distance from listener in meters",
+        )
+        sub.add_argument("--outfile", help="Output filename (write mode only)")
+        sub.add_argument(
+            "--seed",
+            type=_non_negative(int),
+            help="Random seed for reproducible output",
+        )
+
+    return parser
 
-    if len(sys.argv) < 3:
-        print("Error: Siren type required")
+
+def main(argv=None):
+    """Process command line arguments and execute sirens functionality.
+
+    Args:
+        argv: Arguments to parse, excluding the program name. Defaults to
+            ``sys.argv[1:]``.
+    """
+    argv = argv if argv is not None else sys.argv[1:]
+    if not argv:
         print_usage()
         return
 
-    siren_type = sys.argv[2]
-
-    # Parse optional arguments
-    duration = 10
-    night_mode = False
-    traffic_density = "medium"
-    distance = 10
-    outfile = None
-
-    i = 3
-    while i < len(sys.argv):
-        if sys.argv[i] == "--duration" and i + 1 < len(sys.argv):
-            try:
-                duration = float(sys.argv[i + 1])
-                i += 2
-            except ValueError:
-                print(f"Invalid duration: {sys.argv[i + 1]}")
-                return
-        elif sys.argv[i] == "--night":
-            night_mode = True
-            i += 1
-        elif sys.argv[i] == "--traffic" and i + 1 < len(sys.argv):
-            traffic_density = sys.argv[i + 1]
-            if traffic_density not in ["light", "medium", "heavy"]:
-                print(f"Invalid traffic density: {traffic_density}")
-                return
-            i += 2
-        elif sys.argv[i] == "--distance" and i + 1 < len(sys.argv):
-            try:
-                distance = float(sys.argv[i + 1])
-                i += 2
-            except ValueError:
-                print(f"Invalid distance: {sys.argv[i + 1]}")
-                return
-        elif sys.argv[i] == "--outfile" and i + 1 < len(sys.argv):
-            outfile = sys.argv[i + 1]
-            i += 2
-        else:
-            print(f"Unknown option: {sys.argv[i]}")
-            return
+    args = _build_parser().parse_args(argv)
+    args.func(args)
+
 
+def _create_siren(args, config_only=False):
+    """Create the siren described by the parsed arguments.
+
+    Returns:
+        A Siren (or a SirenConfig when ``config_only`` is set), or None if
+        the siren type is unknown
+    """
     # Verify siren type
-    if siren_type not in PRESETS:
-        print(f"Unknown siren type: {siren_type}")
+    if args.siren_type not in PRESETS:
+        print(f"Unknown siren type: {args.siren_type}")
         print(f"Available types: {', '.join(PRESETS.keys())}")
         print("\nUse 'sirens list' to see detailed information about available sirens.")
+        return None
+
+    # Imported here so that 'sirens list' and usage output skip loading it
+    from .core import Siren, SirenConfig
+
+    siren_cls = SirenConfig if config_only else Siren
+    return siren_cls(
+        name=args.siren_type,
+        total_duration=args.duration,
+        night_mode=args.night,
+        traffic_density=args.traffic,
+        distance=args.distance,
+        seed=args.seed,
+    )
+
+
+def _play_command(args):
+    """Generate and play a siren."""
+    siren = _create_siren(args)
+    if siren is None:
         return
+    print(f"Playing {args.siren_type} siren...")
+    print(f"Estimated dB level: {siren._estimate_db()} dB")
+    siren.play()
 
-    # Create siren
-    siren = Siren(
-        name=siren_type,
-        total_duration=duration,
-        night_mode=night_mode,
-        traffic_density=traffic_density,
-        distance=distance,
-    )
 
-    # Execute command
-    if command == "play":
-        print(f"Playing {siren_type} siren...")
-        print(f"Estimated dB level: {siren._estimate_db()} dB")
-        siren.play()
-    elif command == "write":
-        if outfile is None:
-            outfile = f"{siren_type}_{int(duration)}s.wav"
-        filename = siren.write(outfile)
-        print(f"Wrote {filename}")
-        print(f"Estimated dB level: {siren._estimate_db()} dB")
-    elif command == "info":
-        info = siren.get_info()
-        print("\nSiren Information:")
-        print(f"Type: {siren_type}")
-        print(
-            f"Frequencies: {info['frequencies'][0]} Hz and {info['frequencies'][1]} Hz"
-        )
-        print(f"Tone duration: {info['tone_duration']} seconds")
-        print(f"Night mode: {'Enabled' if info['night_mode'] else 'Disabled'}")
-        print(f"Traffic density: {info['traffic_density']}")
-        print(f"Distance from listener: {info['distance']} meters")
-        print(f"Maximum dB at source: {info['max_db_at_source']} dB")
-        print(f"Estimated dB at listener: {info['estimated_db']} dB\n")
-    else:
-        print(f"Unknown command: {command}")
-        print_usage()
+def _write_command(args):
+    """Generate a siren and save it to a WAV file."""
+    siren = _create_siren(args)
+    if siren is None:
+        return
+    outfile = args.outfile
+    if outfile is None:
+        outfile = f"{args.siren_type}_{int(args.duration)}s.wav"
+    filename = siren.write(outfile)
+    print(f"Wrote {filename}")
+    print(f"Estimated dB level: {siren._estimate_db()} dB")
+
+
+def _info_command(args):
+    """Show information about a siren; only its configuration is needed."""
+    siren = _create_siren(args, config_only=True)
+    if siren is None:
+        return
+    info = siren.get_info()
+    print("\nSiren Information:")
+    print(f"Type: {args.siren_type}")
+    print(f"Frequencies: {info['frequencies'][0]} Hz and {info['frequencies'][1]} Hz")
+    print(f"Tone duration: {info['tone_duration']} seconds")
+    print(f"Night mode: {'Enabled' if info['night_mode'] else 'Disabled'}")
+    print(f"Traffic density: {info['traffic_density']}")
+    print(f"Distance from listener: {info['distance']} meters")
+    print(f"Maximum dB at source: {info['max_db_at_source']} dB")
+    print(f"Estimated dB at listener: {info['estimated_db']} dB\n")
 
 
 def list_sirens():
@@ -157,6 +207,7 @@ def print_usage():
     print("  --traffic <light|medium|heavy>        - Traffic density (default: medium)")
     print("  --distance <meters>                   - Distance from listener in meters (default: 10)")
     print("  --outfile <filename>                  - Output filename (write mode only)")
+    print("  --seed <integer>                      - Random seed for reproducible output")
     print("\nExamples:")
     print("  sirens list")
     print("  sirens info police")
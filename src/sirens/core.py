@@ -1,15 +1,55 @@
 """Core Siren class implementation."""
 
+import atexit
+import contextlib
+import math
+import os
+import sys
+import tempfile
 from datetime import datetime
+from functools import cached_property, lru_cache
+from types import MappingProxyType
 
 from .presets import PRESETS
-from .generators import generate_siren_signal
-from .playback import write_wav, play_audio
 from .utils import estimate_db
 
+# The generators and playback modules pull in NumPy, so they are imported
+# where they are first needed to keep ``import sirens`` cheap.
 
-class Siren:
-    """Create and manipulate emergency vehicle siren sounds."""
+# Siren pattern per traffic density: (duty cycle, tone pairs per burst)
+_TRAFFIC = {
+    "light": (0.6, 2),  # More intermittent siren: 60% on, short bursts
+    "medium": (0.8, 4),  # Standard pattern: 80% on, medium bursts
+    "heavy": (0.9, 6),  # More continuous siren: 90% on, long bursts
+}
+
+
+# Longest siren whose samples are kept in the cache below, so that at most
+# about 56MB of float32 samples stay alive after their sirens are gone
+_CACHE_MAX_SECONDS = 10
+
+
+@lru_cache(maxsize=32)
+def _build_samples(*params):
+    """Generate a siren signal, memoized on its generation parameters.
+
+    The returned array is shared between callers, so it is made read-only.
+    """
+    from .generators import generate_siren_signal
+
+    samples = generate_siren_signal(*params)
+    samples.flags.writeable = False
+    return samples
+
+
+def _remove_file(path):
+    """Remove a file, ignoring it if it is already gone."""
+    with contextlib.suppress(OSError):
+        os.remove(path)
+
+
+class SirenConfig:
+    """Describe a siren configuration without generating any audio."""
 
     def __init__(
         self,
@@ -18,19 +58,34 @@ class Siren:
         night_mode=False,
         traffic_density="medium",
         distance=10,
+        seed=None,
     ):
         """
         Initialize a siren simulation.
 
         Parameters:
             name: Type of siren (police, firefighter, samu, hi_lo)
-            total_duration: Total duration in seconds
+            total_duration: Total duration in seconds (raises ValueError if
+                negative or not finite)
             night_mode: If True, reduces volume (simulating night regulations)
             traffic_density: "light", "medium", or "heavy" to simulate different usage patterns
+                (raises ValueError otherwise)
             distance: Simulated distance from the listener in meters
+            seed: Optional non-negative random seed; seeded sirens are
+                reproducible and identical configurations reuse the same
+                generated samples (raises ValueError if negative)
         """
+        if not 0 <= total_duration < math.inf:
+            raise ValueError(
+                f"Invalid duration: {total_duration} (must be a finite number >= 0)"
+            )
+        if seed is not None and seed < 0:
+            raise ValueError(f"Invalid seed: {seed} (must not be negative)")
+
         self.presets = PRESETS
-        self.p = self.presets.get(name, self.presets["police"]).copy()
+        # A read-only view of the shared preset; per-siren adjustments are
+        # kept in separate attributes instead of a mutated copy
+        self.p = MappingProxyType(self.presets.get(name, self.presets["police"]))
         self.freq1, self.freq2 = self.p["freqs"]
         self.tone_duration = self.p["tone_duration"]
         self.attack = self.p["attack"]
@@ -40,49 +95,28 @@ class Siren:
         self.night_mode = night_mode
         self.traffic_density = traffic_density
         self.distance = distance
+        self.seed = seed
+
+        self.volume = self.p["volume"]
 
         # Apply night mode volume reduction (Brussels standard limits to 90dB at night)
         if night_mode:
-            self.p["volume"] *= 0.5  # Significant volume reduction at night
+            self.volume *= 0.5  # Significant volume reduction at night
 
         # Adjust volume based on distance (inverse square law approximation)
-        self.p["volume"] *= min(1.0, (10 / max(1, distance)) ** 2)
+        self.volume *= min(1.0, (10 / max(1, distance)) ** 2)
 
         # Adjust siren pattern based on traffic density
-        if traffic_density == "heavy":
-            # More continuous siren in heavy traffic
-            self.duty_cycle = 0.9  # 90% on, 10% off
-            self.burst_size = 6  # Longer bursts
-        elif traffic_density == "light":
-            # More intermittent siren in light traffic
-            self.duty_cycle = 0.6  # 60% on, 40% off
-            self.burst_size = 2  # Shorter bursts
-        else:  # medium
-            # Standard pattern
-            self.duty_cycle = 0.8  # 80% on, 20% off
-            self.burst_size = 4  # Medium bursts
+        if traffic_density not in _TRAFFIC:
+            raise ValueError(
+                f"Invalid traffic density: {traffic_density} "
+                f"(expected one of {', '.join(_TRAFFIC)})"
+            )
+        self.duty_cycle, self.burst_size = _TRAFFIC[traffic_density]
 
         # Calculate how many complete cycles we need
         self.cycles = int(total_duration / (2 * self.tone_duration) * self.duty_cycle)
 
-        # Generate the samples
-        self.samples = self._generate()
-
-    def _generate(self):
-        """Generate the complete siren signal."""
-        return generate_siren_signal(
-            freq1=self.freq1,
-            freq2=self.freq2,
-            tone_duration=self.tone_duration,
-            attack=self.attack,
-            decay=self.decay,
-            cycles=self.cycles,
-            duty_cycle=self.duty_cycle,
-            burst_size=self.burst_size,
-            sample_rate=self.sample_rate,
-            volume=self.p["volume"],
-        )
-
     def _estimate_db(self):
         """Estimate the actual dB level based on distance and night mode."""
         return estimate_db(self.p["max_db"], self.distance, self.night_mode)
@@ -100,6 +134,61 @@ class Siren:
         }
         return info
 
+
+class Siren(SirenConfig):
+    """Create and manipulate emergency vehicle siren sounds.
+
+    Samples are generated on first access to :attr:`samples`.
+    """
+
+    @cached_property
+    def samples(self):
+        """The generated siren signal, as a writable float32 array."""
+        return self._generate()
+
+    @cached_property
+    def _seed(self):
+        """Seed for generation, drawn once so every render of a siren matches."""
+        if self.seed is not None:
+            return self.seed
+
+        import numpy as np
+
+        return np.random.SeedSequence().entropy
+
+    def _params(self):
+        """Return the generation parameters for this siren."""
+        return (
+            self.freq1,
+            self.freq2,
+            self.tone_duration,
+            self.attack,
+            self.decay,
+            self.cycles,
+            self.duty_cycle,
+            self.burst_size,
+            self.sample_rate,
+            self.volume,
+            self._seed,
+        )
+
+    def _generate(self):
+        """Generate the complete siren signal."""
+        # Unseeded sirens are one-offs and long ones would pin a lot of
+        # memory, so only cache short seeded ones
+        if self.seed is None or self.total_duration > _CACHE_MAX_SECONDS:
+            from .generators import generate_siren_signal
+
+            return generate_siren_signal(*self._params())
+        # The cached array is shared, so each siren gets its own copy
+        return _build_samples(*self._params()).copy()
+
+    def _iter_chunks(self, chunk_seconds=1.0):
+        """Generate the siren signal in chunks of about ``chunk_seconds``."""
+        from .generators import iter_siren_signal
+
+        return iter_siren_signal(*self._params(), chunk_seconds=chunk_seconds)
+
     def write(self, filename=None):
         """Write the siren audio to a WAV file."""
         if filename is None:
@@ -107,9 +196,25 @@ class Siren:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"siren_{timestamp}.wav"
 
-        return write_wav(self.samples, filename, self.sample_rate)
+        from .playback import write_wav, write_wav_chunks
+
+        # Reuse samples that are already in memory, otherwise stream them so
+        # long sirens never need the whole signal at once
+        if "samples" in self.__dict__:
+            return write_wav(self.samples, filename, self.sample_rate)
+        return write_wav_chunks(self._iter_chunks(), filename, self.sample_rate)
 
     def play(self):
-        """Play the siren audio."""
-        tmp_file = self.write("_tmp_siren.wav")
-        return play_audio(tmp_file)
+        """Play the siren audio through a temporary WAV file."""
+        from .playback import play_audio
+
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+            tmp_file = f.name
+        self.write(tmp_file)
+
+        played = play_audio(tmp_file)
+        # On Windows the file is handed to another program without waiting
+        # for it, so it is left in place rather than removed on exit
+        if played and sys.platform != "win32":
+            atexit.register(_remove_file, tmp_file)
+        return played
@@ -1,41 +1,284 @@
 """Audio signal generators for sirens."""
 
 import math
-import random
+from functools import lru_cache
+
+import numpy as np
+
 from ..utils import envelope
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional
+    njit = None
+
+# Slight second-harmonic distortion for realism
+_HARMONIC = 0.15
+
+# sin(x) + h*sin(2x) peaks where its derivative vanishes, i.e. where
+# 4h*cos(x)**2 + cos(x) - 2h = 0, so the waveform can be normalized by a
+# constant instead of scanning every buffer for its maximum
+_PEAK_COS = (math.sqrt(1 + 32 * _HARMONIC**2) - 1) / (8 * _HARMONIC)
+_PEAK_SIN = math.sqrt(1 - _PEAK_COS**2)
+_NORMALIZER = 1 / (_PEAK_SIN * (1 + 2 * _HARMONIC * _PEAK_COS))
+
+# Largest relative pitch error allowed when fitting a tone to a whole number
+# of samples, a tenth of the 1% frequency jitter
+_PITCH_TOLERANCE = 1e-3
+
+
+if njit is not None:
+
+    @njit(
+        "void(float32[:], int64[:], int64[:], int64[:], int64[:], float32[:])",
+        boundscheck=False,
+        cache=True,
+        fastmath=True,
+        parallel=True,
+    )
+    def _render_tones(out, starts, block_samples, block_cycles, offsets, gain):
+        """Write every tone, shaped by ``gain``, into ``out``.
+
+        Phases are counted in whole steps of ``1 / block_samples`` cycle, so
+        they do not drift however long the tones are.
+        """
+        for k in prange(len(starts)):
+            start = starts[k]
+            n = block_samples[k]
+            cycles = block_cycles[k] % n
+            step = 2 * math.pi / n
+            # Sample j of a block sits j * cycles % n steps into its period
+            q = offsets[k] * cycles % n
+            for i in range(len(gain)):
+                p = step * q
+                out[start + i] = (math.sin(p) + _HARMONIC * math.sin(2 * p)) * gain[i]
+                q += cycles
+                if q >= n:
+                    q -= n
+
+else:
+    _render_tones = None
+
+
+@lru_cache(maxsize=64)
+def _tone_block(block_samples, block_cycles):
+    """Return ``block_cycles`` normalized periods of the siren waveform.
+
+    The waveform is a sine with slight second-harmonic distortion, sampled
+    so that the cycles span exactly ``block_samples`` samples. The returned
+    array is shared between callers and read-only.
+    """
+    # Evaluate the fundamental and harmonic phases in a single np.sin call
+    n = block_samples
+    phases = np.empty(2 * n, dtype=np.float32)
+    phases[:n] = np.arange(n, dtype=np.float32)
+    phases[:n] *= 2 * math.pi * block_cycles / n
+    np.multiply(phases[:n], 2, out=phases[n:])
+    np.sin(phases, out=phases)
+
+    block = phases[:n]
+    block += _HARMONIC * phases[n:]
+    block *= _NORMALIZER
+    block.flags.writeable = False
+    return block
+
+
+def _tone_blocks(freq, sample_rate):
+    """Fit each frequency to a block of whole samples holding whole cycles.
+
+    A block of one period is used where rounding the period to whole
+    samples keeps the pitch within ``_PITCH_TOLERANCE``; otherwise the
+    fewest cycles that do are grouped into one block. The tolerance is
+    always met once a block spans ``0.5 / _PITCH_TOLERANCE`` samples.
 
-def generate_sine_wave(freq, duration, sample_rate, attack, decay):
+    Returns:
+        Tuple of (samples per block, cycles per block) arrays
+    """
+    period = sample_rate / np.atleast_1d(np.asarray(freq, dtype=np.float64))
+    block_samples = np.maximum(1, np.rint(period)).astype(np.int64)
+    block_cycles = np.ones(len(period), dtype=np.int64)
+
+    pending = np.abs(block_samples - period) > _PITCH_TOLERANCE * period
+    cycles = 1
+    while pending.any():
+        cycles += 1
+        span = cycles * period[pending]
+        fitted = np.rint(span)
+        fits = np.abs(fitted - span) <= _PITCH_TOLERANCE * span
+        done = np.flatnonzero(pending)[fits]
+        block_samples[done] = fitted[fits]
+        block_cycles[done] = cycles
+        pending[done] = False
+    return block_samples, block_cycles
+
+
+def _block_offsets(cycle_pos, block_samples, block_cycles):
+    """Return the sample of each block whose phase is nearest ``cycle_pos``.
+
+    Blocks hold coprime numbers of samples and cycles (a common factor would
+    have given a smaller block), so sample ``k`` of a block sits ``k *
+    cycles % samples`` steps of ``1 / samples`` cycle into its period.
+    """
+    steps = np.rint((cycle_pos % 1.0) * block_samples).astype(np.int64)
+    inverses = [pow(int(c), -1, int(n)) for c, n in zip(block_cycles, block_samples)]
+    return steps % block_samples * np.array(inverses, dtype=np.int64) % block_samples
+
+
+def generate_sine_wave(freq, duration, sample_rate, attack, decay, phase=0.0):
     """Generate a sine wave with the specified frequency and duration.
 
+    The frequency is adjusted by at most 0.1% so that a whole number of
+    periods spans a whole number of samples, letting one precomputed block
+    be tiled over the whole tone. Use :func:`generate_sine_wave_chained`
+    to get the phase at which the next tone should start.
+
     Args:
         freq: Frequency in Hz
         duration: Duration in seconds
         sample_rate: Sample rate in Hz
         attack: Attack time in seconds
         decay: Decay time in seconds
+        phase: Starting phase in radians
 
     Returns:
-        List of audio samples
+        Array of audio samples
+    """
+    samples, _ = generate_sine_wave_chained(
+        freq, duration, sample_rate, attack, decay, phase
+    )
+    return samples
+
+
+def generate_sine_wave_chained(freq, duration, sample_rate, attack, decay, phase=0.0):
+    """Generate a sine wave and the phase at which it ends.
+
+    Takes the same arguments as :func:`generate_sine_wave`. Passing the
+    returned phase as ``phase`` of the next tone continues the waveform
+    without a phase jump (to within a sample step when the frequency
+    changes).
+
+    Returns:
+        Tuple of (array of audio samples, phase in radians of the sample
+        that would follow the last one)
     """
     n = int(sample_rate * duration)
-    base = [math.sin(2 * math.pi * freq * t / sample_rate) for t in range(n)]
+    block_samples, block_cycles = _tone_blocks(freq, sample_rate)
+    offsets = _block_offsets(phase / (2 * math.pi), block_samples, block_cycles)
+
+    # Render through the same (Numba or NumPy) path as full siren signals
+    samples = np.zeros(n, dtype=np.float32)
+    if n:
+        _render_into(
+            samples,
+            0,
+            np.zeros(1, dtype=np.int64),
+            block_samples,
+            block_cycles,
+            offsets,
+            _tone_envelope(n, attack, decay, sample_rate),
+            1.0,
+        )
+
+    samples_per_block, cycles = int(block_samples[0]), int(block_cycles[0])
+    end = (int(offsets[0]) + n) % samples_per_block
+    end_phase = 2 * math.pi * (end * cycles % samples_per_block) / samples_per_block
+    return samples, end_phase
 
-    # Add slight harmonic distortion for realism
-    harmonic_factor = 0.15
-    harmonic = [
-        harmonic_factor * math.sin(4 * math.pi * freq * t / sample_rate)
-        for t in range(n)
-    ]
 
-    combined = [base[i] + harmonic[i] for i in range(n)]
+def _siren_schedule(
+    freq1, freq2, tone_duration, cycles, duty_cycle, burst_size, sample_rate, seed
+):
+    """Work out where each tone of a siren signal starts and how it sounds.
+
+    Returns:
+        Tuple of (samples per tone, total samples, tone start offsets,
+        samples and cycles per block of each tone, see :func:`_tone_blocks`,
+        and the starting sample of each tone within its block)
+    """
+    n_tone = int(sample_rate * tone_duration)
+    pause_duration = tone_duration * 2 * (1 - duty_cycle) / duty_cycle
+    n_pause = int(pause_duration * sample_rate)
+    n_tones = 2 * max(0, cycles)
+
+    if n_tones == 0 or n_tone == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return n_tone, 0, empty, empty, empty, empty
+
+    # Add slight randomness to frequencies for realism (1% variation)
+    freq1_var = freq1 * 0.01
+    freq2_var = freq2 * 0.01
+    rng = np.random.default_rng(seed)
+    tone_freqs = np.empty(n_tones)
+    tone_freqs[0::2] = freq1 + rng.uniform(-freq1_var, freq1_var, cycles)
+    tone_freqs[1::2] = freq2 + rng.uniform(-freq2_var, freq2_var, cycles)
+
+    # Tones come in bursts of tone pairs separated by a pause, so every tone
+    # is delayed by one pause per preceding burst
+    tone_index = np.arange(n_tones)
+    tone_starts = tone_index * n_tone + (tone_index // 2) // burst_size * n_pause
+    total = int(tone_starts[-1]) + n_tone
+
+    # Fit each tone to a block of whole samples (well within the jitter) and
+    # carry the phase over from one tone to the next
+    block_samples, block_cycles = _tone_blocks(tone_freqs, sample_rate)
+    periods = block_samples / block_cycles
+    tone_cycles = n_tone / periods
+    cycle_pos = np.cumsum(tone_cycles) - tone_cycles
+    offsets = _block_offsets(cycle_pos, block_samples, block_cycles)
+
+    return n_tone, total, tone_starts, block_samples, block_cycles, offsets
 
-    # Normalize to prevent clipping
-    max_val = max(abs(min(combined)), abs(max(combined)))
-    normalized = [s / max_val for s in combined]
 
-    # Apply attack/decay envelope
-    return envelope(normalized, attack, decay, sample_rate)
+@lru_cache(maxsize=32)
+def _tone_envelope(n_tone, attack, decay, sample_rate):
+    """Return the per-tone envelope and the lengths of its two ramps.
+
+    Between the attack and decay ramps the envelope is exactly one. The
+    envelope is computed once per tone shape, shared and read-only.
+    """
+    env = envelope(np.ones(n_tone, dtype=np.float32), attack, decay, sample_rate)
+    env.flags.writeable = False
+    n_decay = int(decay * sample_rate)
+    n_decay = n_decay if 0 < n_decay < n_tone else 0
+    n_attack = min(max(0, int(attack * sample_rate)), n_tone - n_decay)
+    return env, n_attack, n_decay
+
+
+def _render_into(
+    out, origin, tone_starts, block_samples, block_cycles, offsets, tone_env, volume
+):
+    """Render tones into ``out``, whose first sample is at ``origin``."""
+    env, n_attack, n_decay = tone_env
+    starts = tone_starts - origin
+    if _render_tones is not None:
+        _render_tones(
+            out,
+            starts,
+            block_samples,
+            block_cycles,
+            offsets,
+            env * np.float32(volume * _NORMALIZER),
+        )
+        return
+
+    # Tile each distinct block once (with a block to spare) and copy every
+    # tone out at its offset
+    n_tone = len(env)
+    tiled = {}
+    for start, samples, cycles, offset in zip(
+        starts, block_samples, block_cycles, offsets
+    ):
+        key = (int(samples), int(cycles))
+        if key not in tiled:
+            wave = _tone_block(*key) * np.float32(volume)
+            tiled[key] = np.resize(wave, n_tone + key[0])
+        tone = out[start : start + n_tone]
+        tone[...] = tiled[key][offset : offset + n_tone]
+
+        # The envelope is one between its ramps, so only the ends need shaping
+        tone[:n_attack] *= env[:n_attack]
+        if n_decay:
+            tone[-n_decay:] *= env[-n_decay:]
 
 
 def generate_siren_signal(
@@ -49,6 +292,7 @@ def generate_siren_signal(
     burst_size,
     sample_rate,
     volume,
+    seed=None,
 ):
     """Generate a complete siren signal with alternating frequencies.
 
@@ -63,36 +307,75 @@ def generate_siren_signal(
         burst_size: Number of tone pairs per burst
         sample_rate: Sample rate in Hz
         volume: Output volume scaling factor
+        seed: Optional seed for the frequency variations, making the output
+            reproducible
 
     Returns:
-        List of audio samples representing the siren signal
+        Array of audio samples representing the siren signal
+    """
+    n_tone, total, *tones = _siren_schedule(
+        freq1, freq2, tone_duration, cycles, duty_cycle, burst_size, sample_rate, seed
+    )
+    signal = np.zeros(total, dtype=np.float32)
+    if total:
+        tone_env = _tone_envelope(n_tone, attack, decay, sample_rate)
+        _render_into(signal, 0, *tones, tone_env, volume)
+    return signal
+
+
+def iter_siren_signal(
+    freq1,
+    freq2,
+    tone_duration,
+    attack,
+    decay,
+    cycles,
+    duty_cycle,
+    burst_size,
+    sample_rate,
+    volume,
+    seed=None,
+    chunk_seconds=1.0,
+):
+    """Generate a siren signal chunk by chunk.
+
+    Takes the same arguments as :func:`generate_siren_signal`, and yields
+    the same samples (for the same seed) in consecutive float32 arrays.
+    Chunks start on tone boundaries and hold roughly ``chunk_seconds`` of
+    audio, so memory use does not grow with the total duration.
+
+    Args:
+        chunk_seconds: Target duration of each chunk in seconds
+
+    Yields:
+        Arrays of audio samples
     """
-    signal = []
-
-    # Add slight variations to make it more realistic
-    freq1_var = freq1 * 0.01  # 1% variation
-    freq2_var = freq2 * 0.01  # 1% variation
-
-    # Generate in bursts with pauses to simulate realistic usage patterns
-    remaining_cycles = cycles
-    while remaining_cycles > 0:
-        # Determine burst size (how many tone pairs to generate before a pause)
-        burst = min(remaining_cycles, burst_size)
-        remaining_cycles -= burst
-
-        # Generate the burst
-        for _ in range(burst):
-            # Add slight randomness to frequencies for realism
-            f1 = freq1 + random.uniform(-freq1_var, freq1_var)
-            f2 = freq2 + random.uniform(-freq2_var, freq2_var)
-
-            signal += generate_sine_wave(f1, tone_duration, sample_rate, attack, decay)
-            signal += generate_sine_wave(f2, tone_duration, sample_rate, attack, decay)
-
-        # Add a pause if not the last burst
-        if remaining_cycles > 0:
-            pause_duration = tone_duration * 2 * (1 - duty_cycle) / duty_cycle
-            signal += [0] * int(pause_duration * sample_rate)
-
-    # Apply overall volume
-    return [s * volume for s in signal]
+    n_tone, total, tone_starts, *tones = _siren_schedule(
+        freq1, freq2, tone_duration, cycles, duty_cycle, burst_size, sample_rate, seed
+    )
+    if not total:
+        return
+    tone_env = _tone_envelope(n_tone, attack, decay, sample_rate)
+    chunk_samples = max(1, int(chunk_seconds * sample_rate))
+    tone_ends = tone_starts + n_tone
+
+    pos = 0
+    first = 0
+    while first < len(tone_starts):
+        # Take every tone that ends within this chunk (at least one), and run
+        # the chunk up to the start of the next tone
+        last = int(np.searchsorted(tone_ends, pos + chunk_samples, side="right"))
+        last = max(last, first + 1)
+        end = int(tone_starts[last]) if last < len(tone_starts) else total
+
+        chunk = np.zeros(end - pos, dtype=np.float32)
+        _render_into(
+            chunk,
+            pos,
+            tone_starts[first:last],
+            *(arr[first:last] for arr in tones),
+            tone_env,
+            volume,
+        )
+        yield chunk
+        pos, first = end, last
@@ -1,34 +1,94 @@
 """Audio playback functionality for siren sounds."""
 
 import os
-import struct
+import shutil
+import subprocess
 import sys
 import wave
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    import soundfile
+except ImportError:  # soundfile is optional
+    soundfile = None
+
+
+def _to_pcm16(samples):
+    """Scale samples in [-1, 1] to little-endian 16-bit PCM."""
+    pcm = np.asarray(samples, dtype=np.float32) * 32767.0
+    np.clip(pcm, -32768, 32767, out=pcm)
+    return pcm.astype("<i2")
 
 
 def write_wav(samples, filename, sample_rate=44100):
     """Write audio samples to a WAV file.
 
+    Uses libsndfile through ``soundfile`` when it is installed, and the
+    standard library ``wave`` module otherwise.
+
     Args:
-        samples: List of audio samples
+        samples: Array (or list) of audio samples in the range [-1, 1]
         filename: Output filename
         sample_rate: Sample rate in Hz
 
     Returns:
         The filename of the written WAV file
     """
+    return write_wav_chunks([samples], filename, sample_rate)
+
+
+def write_wav_chunks(chunks, filename, sample_rate=44100):
+    """Write audio samples to a WAV file one chunk at a time.
+
+    Only one chunk is held in memory at a time, so ``chunks`` can be a
+    generator producing arbitrarily long audio.
+
+    Args:
+        chunks: Iterable of sample arrays in the range [-1, 1]
+        filename: Output filename
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        The filename of the written WAV file
+    """
+    if soundfile is not None:
+        with soundfile.SoundFile(
+            filename, "w", sample_rate, 1, subtype="PCM_16", format="WAV"
+        ) as sf:
+            for chunk in chunks:
+                sf.write(_to_pcm16(chunk))
+        return filename
+
     with wave.open(filename, "w") as wf:
         wf.setnchannels(1)  # Mono
         wf.setsampwidth(2)  # 16-bit
         wf.setframerate(sample_rate)
-
-        # Write each sample, scaling to 16-bit range
-        for s in samples:
-            wf.writeframes(struct.pack("h", int(s * 32767)))
+        for chunk in chunks:
+            wf.writeframes(_to_pcm16(chunk).tobytes())
 
     return filename
 
 
+@lru_cache(maxsize=None)
+def _find_player():
+    """Return the command line prefix of the platform's audio player.
+
+    The player is looked up on PATH once and remembered; None means the
+    platform is unsupported or its player is not installed.
+    """
+    if sys.platform == "darwin":  # macOS
+        player, options = "afplay", []
+    elif sys.platform == "linux" or sys.platform == "linux2":
+        player, options = "aplay", ["-q"]
+    else:
+        return None
+
+    path = shutil.which(player)
+    return [path, *options] if path else None
+
+
 def play_audio(filename):
     """Play an audio file using the system's default audio player.
 
@@ -36,18 +96,18 @@ def play_audio(filename):
         filename: Path to the audio file to play
 
     Returns:
-        True if playback was attempted, False if platform is unsupported
+        True if playback was attempted, False if the platform is unsupported
+        or its audio player is not installed
     """
-    # Determine which command to use based on platform
-    if sys.platform == "darwin":  # macOS
-        os.system(f"afplay {filename}")
-        return True
-    elif sys.platform == "linux" or sys.platform == "linux2":
-        os.system(f"aplay {filename}")
+    if sys.platform == "win32":
+        os.startfile(filename)
         return True
-    elif sys.platform == "win32":
-        os.system(f"start {filename}")
-        return True
-    else:
+
+    player = _find_player()
+    if player is None:
         print(f"Audio file saved to {filename} but couldn't play automatically.")
         return False
+
+    # Run the player directly rather than through a shell
+    subprocess.run([*player, filename], check=False)
+    return True
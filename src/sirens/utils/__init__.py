@@ -1,12 +1,40 @@
 """Utility functions for siren processing."""
 
 import math
-import numpy as np
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
+def _make_envelope(total_samples, attack_samples, decay_samples):
+    """Build an attack/sustain/decay envelope of ``total_samples`` samples.
+
+    Envelopes are cached per length and ramp sizes, so the returned array
+    is shared between callers and read-only.
+    """
+    import numpy as np
+
+    # The decay only applies when the signal is longer than it, and takes
+    # precedence over the attack where the two would overlap
+    if decay_samples >= total_samples:
+        decay_samples = 0
+    attack = np.linspace(0, 1, attack_samples, dtype=np.float32)
+    env = np.concatenate(
+        [
+            attack[: total_samples - decay_samples],
+            np.ones(max(0, total_samples - attack_samples - decay_samples), np.float32),
+            np.linspace(1, 0, decay_samples, dtype=np.float32),
+        ]
+    )
+    env.flags.writeable = False
+    return env
 
 
 def envelope(samples, attack, decay, sample_rate):
     """Apply an attack/decay envelope to a sample array.
 
+    The envelope is applied in place when ``samples`` is already a NumPy
+    array.
+
     Args:
         samples: Audio samples to process
         attack: Attack time in seconds
@@ -14,25 +42,32 @@ def envelope(samples, attack, decay, sample_rate):
         sample_rate: Audio sample rate in Hz
 
     Returns:
-        List of processed samples with envelope applied
+        Array of processed samples with envelope applied
     """
-    attack_samples = int(attack * sample_rate)
-    decay_samples = int(decay * sample_rate)
-    total_samples = len(samples)
+    import numpy as np
+
+    if not isinstance(samples, np.ndarray) or samples.dtype.kind != "f":
+        samples = np.asarray(samples, dtype=np.float32)
+    attack_samples = max(0, int(attack * sample_rate))
+    decay_samples = max(0, int(decay * sample_rate))
+
+    # Apply the (cached) envelope to samples
+    samples *= _make_envelope(len(samples), attack_samples, decay_samples)
+    return samples
 
-    # Create envelope
-    env = np.ones(total_samples)
 
-    # Apply attack
-    if attack_samples > 0:
-        env[:attack_samples] = np.linspace(0, 1, attack_samples)
+# Attenuation in dB for every whole meter up to _DB_TABLE_MAX, so the common
+# integer distances are a plain index instead of a log10 call
+_DB_TABLE_MAX = 500
+_DB_TABLE = tuple(20 * math.log10(max(1, d)) for d in range(_DB_TABLE_MAX + 1))
 
-    # Apply decay
-    if decay_samples > 0 and total_samples > decay_samples:
-        env[-decay_samples:] = np.linspace(1, 0, decay_samples)
 
-    # Apply envelope to samples
-    return [samples[i] * env[i] for i in range(total_samples)]
+def _db_reduction(distance):
+    """Return the attenuation in dB at ``distance`` meters (at least 1m)."""
+    if math.isfinite(distance) and 0 <= distance <= _DB_TABLE_MAX:
+        if float(distance).is_integer():
+            return _DB_TABLE[int(distance)]
+    return 20 * math.log10(max(1, distance))
 
 
 def estimate_db(max_db_at_source, distance, night_mode=False):
@@ -50,7 +85,7 @@ def estimate_db(max_db_at_source, distance, night_mode=False):
         return max_db_at_source
 
     # Basic inverse square law for sound propagation
-    db_reduction = 20 * math.log10(max(1, distance))
+    db_reduction = _db_reduction(distance)
     estimated_db = max_db_at_source - db_reduction
 
     # Additional reduction for night mode
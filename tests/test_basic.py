@@ -157,6 +157,208 @@ def test_cli_structure():
         return False
 
 
+def test_seeded_generation():
+    """Test that seeded sirens are reproducible and share cached samples."""
+    print("\nTesting seeded generation...")
+    from sirens import Siren
+    from sirens.core import _build_samples
+
+    first = Siren(name="police", total_duration=2, seed=42)
+    second = Siren(name="police", total_duration=2, seed=42)
+    first.samples
+    hits = _build_samples.cache_info().hits
+    if (second.samples == first.samples).all() and _build_samples.cache_info().hits > hits:
+        print("  ✓ Identical seeded sirens reuse the cached samples")
+    else:
+        print("  ✗ Identical seeded sirens generated separate samples")
+        return False
+
+    second.samples *= 0.5
+    if second.samples is not first.samples and first.samples.flags.writeable:
+        print("  ✓ Seeded sirens get their own writable samples")
+    else:
+        print("  ✗ Seeded sirens share read-only samples")
+        return False
+
+    cached = _build_samples.cache_info().currsize
+    Siren(name="police", total_duration=60, seed=42).samples
+    if _build_samples.cache_info().currsize == cached:
+        print("  ✓ Long seeded sirens are not kept in the cache")
+    else:
+        print("  ✗ A long seeded siren was kept in the cache")
+        return False
+
+    other = Siren(name="police", total_duration=2, seed=7)
+    if len(other.samples) == len(first.samples) and (other.samples != first.samples).any():
+        print("  ✓ Different seeds produce different variations")
+    else:
+        print("  ✗ Different seeds produced identical samples")
+        return False
+
+    return True
+
+
+def test_sample_dtype():
+    """Test that generated audio stays in float32 end to end."""
+    print("\nTesting sample dtype...")
+    import numpy as np
+    from sirens import Siren
+    from sirens.generators import generate_sine_wave
+    from sirens.utils import envelope
+
+    arrays = {
+        "Siren.samples": Siren(name="samu", total_duration=1, seed=1).samples,
+        "generate_sine_wave": generate_sine_wave(435, 0.1, 44100, 0.01, 0.01),
+        "envelope (list input)": envelope([1.0] * 100, 0.001, 0.001, 44100),
+    }
+    for name, arr in arrays.items():
+        if arr.dtype == np.float32:
+            print(f"  ✓ {name} is float32")
+        else:
+            print(f"  ✗ {name} is {arr.dtype}")
+            return False
+
+    return True
+
+
+def test_streamed_generation():
+    """Test that chunked generation matches whole-signal generation."""
+    print("\nTesting streamed generation...")
+    import numpy as np
+    from sirens.generators import generate_siren_signal, iter_siren_signal
+
+    params = (435, 580, 0.4, 0.05, 0.05, 10, 0.8, 4, 44100, 0.9)
+    full = generate_siren_signal(*params, seed=3)
+    chunks = list(iter_siren_signal(*params, seed=3, chunk_seconds=0.5))
+    if len(chunks) > 1 and np.array_equal(np.concatenate(chunks), full):
+        print(f"  ✓ {len(chunks)} chunks match the full signal")
+    else:
+        print("  ✗ Streamed chunks differ from the full signal")
+        return False
+
+    return True
+
+
+def test_chained_tones():
+    """Test that a tone started at the previous end phase continues it."""
+    print("\nTesting chained tones...")
+    import numpy as np
+    from sirens.generators import generate_sine_wave, generate_sine_wave_chained
+
+    for freq in (435, 1200, 8000):
+        first, phase = generate_sine_wave_chained(freq, 0.4, 44100, 0, 0)
+        second, _ = generate_sine_wave_chained(freq, 0.4, 44100, 0, 0, phase)
+        whole = generate_sine_wave(freq, 0.8, 44100, 0, 0)
+        if np.allclose(np.concatenate([first, second]), whole, atol=1e-3):
+            print(f"  ✓ {freq} Hz tones chain without a phase jump")
+        else:
+            print(f"  ✗ {freq} Hz tones jump in phase where they meet")
+            return False
+
+    return True
+
+
+def test_config_validation():
+    """Test that invalid siren configurations are rejected."""
+    print("\nTesting configuration validation...")
+    from sirens import SirenConfig
+
+    invalid = {
+        "traffic density": {"traffic_density": "rush_hour"},
+        "duration": {"total_duration": -5},
+        "seed": {"seed": -1},
+    }
+    for name, kwargs in invalid.items():
+        try:
+            SirenConfig(name="police", **kwargs)
+        except ValueError as e:
+            print(f"  ✓ Invalid {name} rejected: {e}")
+        else:
+            print(f"  ✗ Invalid {name} was accepted")
+            return False
+
+    return True
+
+
+def test_waveform_peak():
+    """Test that the normalized waveform peaks at full scale."""
+    print("\nTesting waveform peak...")
+    import numpy as np
+    from sirens.generators import generate_sine_wave
+
+    for freq in (435, 1500, 8000):
+        peak = np.abs(generate_sine_wave(freq, 1.0, 44100, 0, 0)).max()
+        if 0.99 <= peak <= 1.0 + 1e-6:
+            print(f"  ✓ {freq} Hz tone peaks at {peak:.4f}")
+        else:
+            print(f"  ✗ {freq} Hz tone peaks at {peak:.4f}")
+            return False
+
+    return True
+
+
+def test_db_estimates():
+    """Test dB estimates on both sides of the precomputed table's range."""
+    print("\nTesting dB estimates...")
+    import math
+    from sirens.utils import estimate_db
+
+    for distance in (0.5, 1, 10, 10.5, 500, 500.5, 501, 2000):
+        expected = round(120 - 20 * math.log10(max(1, distance)), 1)
+        if estimate_db(120, distance) != expected:
+            print(f"  ✗ {distance}m gave {estimate_db(120, distance)} dB, expected {expected}")
+            return False
+    print("  ✓ Estimates match the inverse square law around the table range")
+
+    if estimate_db(120, float("inf")) == -math.inf and estimate_db(120, 0) == 120:
+        print("  ✓ Infinite and zero distances are handled")
+    else:
+        print("  ✗ Infinite or zero distance gave an unexpected estimate")
+        return False
+
+    return True
+
+
+def test_numba_rendering():
+    """Test that the optional Numba kernel matches the NumPy path."""
+    print("\nTesting Numba rendering...")
+    import numpy as np
+    from sirens import generators
+
+    kernel = generators._render_tones
+    if kernel is None:
+        print("  - numba is not installed, skipped")
+        return True
+
+    renders = {
+        "60s 435 Hz tone": lambda: generators.generate_sine_wave(
+            435, 60, 44100, 0.01, 0.01
+        ),
+        "5s 8000 Hz tone": lambda: generators.generate_sine_wave(
+            8000, 5, 44100, 0.01, 0.01
+        ),
+        "siren with 5s tones": lambda: generators.generate_siren_signal(
+            700, 900, 5, 0.05, 0.05, 2, 0.8, 4, 44100, 0.9, seed=3
+        ),
+    }
+    try:
+        for name, render in renders.items():
+            fast = render()
+            generators._render_tones = None
+            exact = render()
+            generators._render_tones = kernel
+            diff = np.abs(fast - exact).max()
+            if diff <= 1e-4:
+                print(f"  ✓ {name} matches (max difference {diff:.1e})")
+            else:
+                print(f"  ✗ {name} differs by up to {diff:.1e}")
+                return False
+    finally:
+        generators._render_tones = kernel
+
+    return True
+
+
 def main():
     """Run all tests."""
     print("=== Sirens Package Test Suite ===\n")
@@ -167,6 +369,14 @@ def main():
         ("Preset Validation", test_validation),
         ("Custom Siren Registration", test_custom_registration),
         ("CLI Structure", test_cli_structure),
+        ("Seeded Generation", test_seeded_generation),
+        ("Sample Dtype", test_sample_dtype),
+        ("Streamed Generation", test_streamed_generation),
+        ("Chained Tones", test_chained_tones),
+        ("Configuration Validation", test_config_validation),
+        ("Waveform Peak", test_waveform_peak),
+        ("dB Estimates", test_db_estimates),
+        ("Numba Rendering", test_numba_rendering),
     ]
     
     results = []